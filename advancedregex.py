@@ -1,4 +1,15 @@
 import re
+from types import MappingProxyType
+
+try:
+    import hyperscan
+except ImportError:  # optional: bulk scans fall back to re
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional: literal prefilter falls back to `in`
+    ahocorasick = None
 
 # ----- Administrative & Agency Patterns -----
 ADMIN_CITATION_PATTERNS = [
@@ -18,6 +29,148 @@ ADMIN_CITATION_PATTERNS = [
     re.compile(r'\b[A-Z][a-z]+ Admin(?:istrative)? (?:Board|Commission|Agency)\b', re.IGNORECASE)
 ]
 
+
+_NAMED_GROUP = re.compile(r'(?<!\\)\(\?P<\w+>')
+
+
+def _fuse(named_patterns):
+    """
+    Fuse (name, compiled pattern) pairs into one alternation with one named
+    group per branch, so a single engine pass both matches and tells us
+    which branch hit (``m.lastgroup``). Inner named groups become plain
+    groups so names can't clash across branches; per-pattern IGNORECASE is
+    kept scoped to its own branch.
+    """
+    branches = []
+    for name, pat in named_patterns:
+        src = _NAMED_GROUP.sub('(?:', pat.pattern)
+        if pat.flags & re.IGNORECASE:
+            src = f'(?i:{src})'
+        branches.append(f'(?P<{name}>{src})')
+    return re.compile('|'.join(branches))
+
+
+def combine_patterns(patterns, prefix):
+    """
+    Fuse a list of compiled patterns into one alternation whose branches are
+    named ``<prefix>_<index>``. ``combined.match(text)`` succeeds exactly
+    when some pattern in the list matches, trying them in list order, and
+    ``m.lastgroup`` names the branch that hit. The patterns' own named groups
+    are not kept, so use the original pattern to read fields. Of the
+    patterns' flags only IGNORECASE is carried over.
+    """
+    return _fuse((f'{prefix}_{i}', pat) for i, pat in enumerate(patterns))
+
+
+ADMIN_COMBINED = combine_patterns(ADMIN_CITATION_PATTERNS, 'admin')
+
+# Case-sensitive twins of the IGNORECASE admin patterns, for running against
+# text that has already been lower-cased once (skips per-char case folding).
+# Derived from each pattern's own source so a twin can't drift from it.
+# Lower-casing would turn an escape like \S into \s, so a source with an
+# upper-case escape gets no twin and scan_text runs it on the original text.
+_UPPER_ESCAPE = re.compile(r'\\[A-Z]')
+ADMIN_LOWERCASE_TWINS = {
+    pat: re.compile(pat.pattern.lower())
+    for pat in ADMIN_CITATION_PATTERNS
+    if pat.flags & re.IGNORECASE and not _UPPER_ESCAPE.search(pat.pattern)
+}
+
+# Characters Python's IGNORECASE matches against ASCII letters (ı/İ→i,
+# ſ→s, K→k). The prefilters and lower-case twins don't account for them,
+# so text containing any of these takes the plain path.
+_ASCII_FOLDING_CHARS = re.compile('[\u0130\u0131\u017f\u212a]')
+
+# Lower-cased literals, one of which must appear in any match of the
+# ADMIN_CITATION_PATTERNS entry at the same index
+ADMIN_LITERALS = [
+    ('federal charge no.',),
+    ('reg.',),
+    ('c.f.r.',),
+    ('enforcement guidance',),
+    ('enforcement manuals', 'internal revenue manual'),
+    ('wage and hour opinion letters', 'advisory opinions'),
+    ('no-action letters',),
+    ('revenue rulings', 'private letter rulings'),
+    ('consent decrees', 'settlement agreements'),
+    ('agency',),
+    ('amicus briefs',),
+    ('cms', 'epa'),
+    ('board',),
+    (' admin',),
+]
+
+
+# A row that drifts from its pattern would make admin_candidates() skip text
+# the pattern matches, so check the table against the sources at import:
+# one row per pattern, and each literal present in the pattern's lower-cased
+# source once escapes like "\." are reduced to the character they escape
+_ESCAPED_PUNCT = re.compile(r'\\([^0-9A-Za-z])')
+
+
+def _check_admin_literals():
+    if len(ADMIN_LITERALS) != len(ADMIN_CITATION_PATTERNS):
+        raise ValueError(
+            f'ADMIN_LITERALS has {len(ADMIN_LITERALS)} rows for '
+            f'{len(ADMIN_CITATION_PATTERNS)} ADMIN_CITATION_PATTERNS'
+        )
+    for i, (pat, literals) in enumerate(zip(ADMIN_CITATION_PATTERNS, ADMIN_LITERALS)):
+        source = _ESCAPED_PUNCT.sub(r'\1', pat.pattern.lower())
+        missing = [lit for lit in literals if lit not in source]
+        if missing:
+            raise ValueError(
+                f'ADMIN_LITERALS[{i}] {missing} not found in pattern {pat.pattern!r}'
+            )
+
+
+_check_admin_literals()
+
+
+def _build_admin_automaton():
+    by_literal = {}
+    for i, literals in enumerate(ADMIN_LITERALS):
+        for lit in literals:
+            by_literal.setdefault(lit, []).append(i)
+    automaton = ahocorasick.Automaton()
+    for lit, idxs in by_literal.items():
+        automaton.add_word(lit, tuple(idxs))
+    automaton.make_automaton()
+    return automaton
+
+
+_ADMIN_AC = _build_admin_automaton() if ahocorasick is not None else None
+
+
+def admin_candidates(text):
+    """
+    Return the indexes of ADMIN_CITATION_PATTERNS that could match somewhere
+    in `text`, judged by their required literals alone. Patterns not in the
+    result cannot match and need not be run.
+    """
+    if _ASCII_FOLDING_CHARS.search(text):
+        return set(range(len(ADMIN_CITATION_PATTERNS)))
+    return _admin_candidates_lowered(text.lower())
+
+
+def _admin_candidates_lowered(lowered):
+    if _ADMIN_AC is not None:
+        return {i for _, idxs in _ADMIN_AC.iter(lowered) for i in idxs}
+    return {
+        i for i, literals in enumerate(ADMIN_LITERALS)
+        if any(lit in lowered for lit in literals)
+    }
+
+
+def classify_admin(text):
+    """
+    Return the index into ADMIN_CITATION_PATTERNS of the first pattern that
+    matches at the start of `text`, or None if none does.
+    """
+    m = ADMIN_COMBINED.match(text)
+    if m is None:
+        return None
+    return int(m.lastgroup.rsplit('_', 1)[1])
+
 # ----- Regulation Patterns -----
 FEDERAL_REGULATION_PATTERN = re.compile(
     r'^(?P<title>\d+)\s+C\.F\.R\.\s+§\s*(?P<section>[\d\.\-]+)$'
@@ -34,6 +187,14 @@ STATE_REGULATION_PATTERNS = [
     )
 ]
 
+# Both forms above share the "<St.> Admin. Code" prefix; match it once and
+# branch on the suffix. The rule number lands in number1 or number2.
+STATE_REG_COMBINED = re.compile(
+    r'^(?P<state_abbrev>[A-Za-z\.]+)\s+Admin\.\s+Code'
+    r'(?:\s+r\.\s*(?P<number1>[\d\-\w\. ]+)(?:\s+§\s*(?P<section>[\d\.\-()]+))?'
+    r'|,\s+Rule\s+(?P<number2>[\d\-\w\.\(\)]+))$', re.IGNORECASE
+)
+
 # ----- Executive Orders & Proclamations -----
 EXECUTIVE_ORDER_PATTERN = re.compile(r'^Exec\. Order No\.\s*\d+.*', re.IGNORECASE)
 PROCLAMATION_PATTERN = re.compile(r'^Proclamation No\.\s*\d+.*', re.IGNORECASE)
@@ -58,9 +219,9 @@ SLIP_OPINION_PATTERN = re.compile(
 
 # ----- Exported maps for advanced use -----
 ADVANCED_PATTERNS = {
-    'admin': ADMIN_CITATION_PATTERNS,
+    'admin': ADMIN_COMBINED,
     'federal_regulation': FEDERAL_REGULATION_PATTERN,
-    'state_regulation': STATE_REGULATION_PATTERNS,
+    'state_regulation': STATE_REG_COMBINED,
     'executive_order': EXECUTIVE_ORDER_PATTERN,
     'proclamation': PROCLAMATION_PATTERN,
     'agency_adjudication': AGENCY_ADJUDICATION_PATTERN,
@@ -70,4 +231,98 @@ ADVANCED_PATTERNS = {
     'slip_opinion': SLIP_OPINION_PATTERN,
 }
 
-ADVANCED_VALIDATORS = {kind: ADVANCED_PATTERNS[kind] for kind in ADVANCED_PATTERNS}
+# read-only view, not a copy: validators are exactly the patterns above
+ADVANCED_VALIDATORS = MappingProxyType(ADVANCED_PATTERNS)
+
+# One pass over every advanced kind, tried in ADVANCED_PATTERNS order
+ADVANCED_SCANNER = _fuse(ADVANCED_PATTERNS.items())
+
+
+def classify_advanced(text):
+    """
+    Return (kind, match) for the first ADVANCED_PATTERNS kind that matches at
+    the start of `text`, or None. The kind is picked by ADVANCED_SCANNER in a
+    single engine pass; `match` comes from that kind's own pattern, so its
+    named groups are available.
+    """
+    m = ADVANCED_SCANNER.match(text)
+    if m is None:
+        return None
+    kind = m.lastgroup
+    return kind, ADVANCED_PATTERNS[kind].match(text)
+
+# ----- Bulk document scanning -----
+# Every pattern a document scan looks for, tagged with its kind. The admin
+# list is kept per-pattern so each one can be skipped independently.
+SCAN_PATTERNS = [('admin', pat) for pat in ADMIN_CITATION_PATTERNS] + [
+    (kind, pat) for kind, pat in ADVANCED_PATTERNS.items() if kind != 'admin'
+]
+
+
+def _build_scan_database():
+    """
+    Compile SCAN_PATTERNS into one Hyperscan database. Prefilter mode lets
+    Hyperscan accept constructs it can't run exactly (possessive runs,
+    anchors) while still reporting every pattern that could match.
+    """
+    base = (hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+            | hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH)
+    flags = [
+        base | (hyperscan.HS_FLAG_CASELESS if pat.flags & re.IGNORECASE else 0)
+        for _, pat in SCAN_PATTERNS
+    ]
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[pat.pattern.encode('utf-8') for _, pat in SCAN_PATTERNS],
+        ids=list(range(len(SCAN_PATTERNS))),
+        elements=len(SCAN_PATTERNS),
+        flags=flags,
+    )
+    return db
+
+
+_SCAN_DB = _build_scan_database() if hyperscan is not None else None
+
+
+def scan_text(text, callback):
+    """
+    Call callback(kind, match) for every match of SCAN_PATTERNS in `text`,
+    in SCAN_PATTERNS order. With Hyperscan installed, one pass over the
+    text picks out the patterns present and only those are run through re;
+    without it, admin_candidates() prunes the admin patterns instead. The
+    results are identical either way.
+    """
+    lowered = text.lower()
+    if _ASCII_FOLDING_CHARS.search(text):
+        candidates = SCAN_PATTERNS
+        lowered = None
+    elif _SCAN_DB is None:
+        # no Hyperscan: at least skip admin patterns whose literals are absent
+        n_admin = len(ADMIN_CITATION_PATTERNS)
+        hits = _admin_candidates_lowered(lowered)
+        candidates = [SCAN_PATTERNS[i] for i in sorted(hits)]
+        candidates += SCAN_PATTERNS[n_admin:]
+    else:
+        hits = set()
+        _SCAN_DB.scan(
+            text.encode('utf-8'),
+            match_event_handler=lambda pid, start, end, flags, ctx: hits.add(pid)
+        )
+        candidates = [SCAN_PATTERNS[i] for i in sorted(hits)]
+
+    # offsets only line up if lower() kept every character one-for-one
+    if lowered is not None and len(lowered) != len(text):
+        lowered = None
+
+    for kind, pat in candidates:
+        twin = ADMIN_LOWERCASE_TWINS.get(pat)
+        if twin is None or lowered is None:
+            for m in pat.finditer(text):
+                callback(kind, m)
+            continue
+        # find spans on the lower-cased text, then re-match the original
+        # pattern there so callers get a match over the original text
+        for hit in twin.finditer(lowered):
+            m = pat.match(text, hit.start())
+            if m is not None:
+                callback(kind, m)
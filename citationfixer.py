@@ -1,30 +1,68 @@
 import re
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from newcitechecker import CitationChecker, CitationValidationException
-from typing import Optional
+from typing import List, Optional
 
+# Parsed right-to-left so no two lazy groups compete for the same text:
+# pin the trailing year first, then find volume/reporter/page in what's left.
+_YEAR_TAIL_RE = re.compile(r'\s*(?P<year>\d{4})\.?$')
+_VRP_RE = re.compile(
+    r'\s+(?P<vol>\d+)\s+'             # volume
+    r'(?P<rep>[A-Za-z\.\']+)\s+'      # reporter
+    r'(?P<page>\d+)'                  # page
+)
+
+# bound once so the hot path skips the attribute lookups
+_YEAR_TAIL_SEARCH = _YEAR_TAIL_RE.search
+_VRP_SEARCH = _VRP_RE.search
+
+# Anything either validation or fix_citation_format could accept has a
+# volume, a reporter-ish token and, later on, a four-digit year
+_VOLUME_RE = re.compile(r'\d+\s+\S')
+_FOUR_DIGITS_RE = re.compile(r'\d{4}')
+
+
+def _has_citation_shape(citation: str) -> bool:
+    # two forward searches rather than one '.*' pattern, so this stays linear
+    vol = _VOLUME_RE.search(citation)
+    return vol is not None and _FOUR_DIGITS_RE.search(citation, vol.end()) is not None
+
+# validate_full_citation only reads checker state, so one instance can
+# serve every auto_fix_citation call
+_CHECKER = CitationChecker()
+
+
+@functools.lru_cache(maxsize=4096)
 def fix_citation_format(citation: str) -> str:
+    # strip() returns the same object when there is nothing to trim, so the
+    # usual case costs no copy. Matching on str (not Latin-1 bytes) also keeps
+    # characters like the ’ in “Ass’n” intact.
     orig = citation.strip()
 
-    # Try one clean regex first:
-    m = re.match(
-        r'^(?P<case>.+?)\s+'              # case name (greedy up to volume)
-        r'(?P<vol>\d+)\s+'               # volume
-        r'(?P<rep>[A-Za-z\.\']+)\s+'     # reporter
-        r'(?P<page>\d+)\s*'              # page
-        r'(?P<court>.+?)?\s*'            # court name (optional)
-        r'(?P<year>\d{4})\.?$',          # year
-        orig
-    )
-    if m:
-        case   = m.group('case').strip()
-        vol    = m.group('vol')
-        rep    = m.group('rep')
-        page   = m.group('page')
-        court  = (m.group('court') or '').strip()
-        year   = m.group('year')
-        # rebuild into exactly “Case, Volume Reporter Page (Court Year)”
-        inside = f"{court} {year}".strip()
-        return f"{case}, {vol} {rep} {page} ({inside})"
+    # 1) the year must close the string
+    y = _YEAR_TAIL_SEARCH(orig)
+    if y:
+        head = orig[:y.start()]
+        # 2) first volume/reporter/page after a non-empty case name;
+        #    whatever follows the page is the court. Neither the case name
+        #    nor the court may span lines, so a court with a newline moves
+        #    on to the next volume/reporter/page.
+        m = _VRP_SEARCH(head, 1)
+        while m:
+            case   = head[:m.start()].strip()
+            if '\n' in case:
+                break   # the case name only grows from here
+            court  = head[m.end():].strip()
+            if '\n' not in court:
+                vol    = m.group('vol')
+                rep    = m.group('rep')
+                page   = m.group('page')
+                year   = y.group('year')
+                # rebuild into exactly “Case, Volume Reporter Page (Court Year)”
+                inside = f"{court} {year}".strip()
+                return f"{case}, {vol} {rep} {page} ({inside})"
+            m = _VRP_SEARCH(head, m.start('vol'))
 
     # fallback: if nothing matched, just hand back the original string
     return orig
@@ -35,6 +73,7 @@ class CitationFixError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=4096)
 def auto_fix_citation(
     citation: str,
     provided_quote: Optional[str] = None,
@@ -43,8 +82,19 @@ def auto_fix_citation(
     """
     Validate with CitationChecker; if it fails, attempt to fix.
     If the fix works, return the new citation. Otherwise raise CitationFixError.
+    Successful results are memoized; failures are not cached and re-run.
     """
-    checker = CitationChecker()
+    checker = _CHECKER
+
+    # caller misuse is reported as such, whatever the citation text
+    if provided_quote is not None and pincite is None:
+        raise ValueError("A pincite is required when supplying a quotation for verification.")
+
+    # 0) Structurally hopeless input: skip the checker and the fix attempt.
+    #    Only when there is nothing to strip: fix_citation_format would
+    #    otherwise "change" it, and the full path reports that differently.
+    if citation == citation.strip() and not _has_citation_shape(citation):
+        raise CitationFixError(f"No changes made; still invalid: {citation}")
 
     # 1) Try validating the original
     try:
@@ -71,3 +121,18 @@ def auto_fix_citation(
             f"Original errors: {e}\n"
             f"Tried fix: '{fixed}'"
         )
+
+
+def fix_citations_bulk(
+    citations: List[str],
+    workers: Optional[int] = None,
+    chunksize: int = 64
+) -> List[str]:
+    """
+    Run auto_fix_citation over many citations on a process pool, returning
+    results in input order. Same outcome as calling it in a loop: the first
+    citation that can't be fixed raises its CitationFixError. Each worker
+    imports this module and so builds its own _CHECKER.
+    """
+    with ProcessPoolExecutor(workers) as ex:
+        return list(ex.map(auto_fix_citation, citations, chunksize=chunksize))
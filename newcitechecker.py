@@ -1,5 +1,6 @@
 import re
 import difflib
+import functools
 from typing import Any, Dict, Optional, Tuple, Literal, List
 from dataclasses import dataclass
 from constants import (
@@ -12,7 +13,7 @@ from constants import (
     CITATION_SIGNALS_ORDERED,
     WORD_ABBREVIATIONS)
 
-from regex import PATTERNS, VALIDATORS
+from patterns import PATTERNS, VALIDATORS
 import advancedregex 
 
 
@@ -40,18 +41,27 @@ class CitationValidationException(Exception):
         self.errors = errors
 
 
-# Pre-compile: match full month names only inside a parenthetical ending in a 4-digit year
-_month_pattern = re.compile(
-    r'\b(' + '|'.join(MONTH_ABBREVIATIONS.keys()) + r')'
-    r'(?=[^)]*\b\d{4}\))'
-)
+# Pre-compile: match full month names only inside a parenthetical ending in a 4-digit year.
+# Rather than a lookahead re-scanning to the next ')' from every month name,
+# cut the text into ')'-terminated spans once and keep those ending in
+# "YYYY)"; a month qualifies exactly when it sits in one of them.
+_month_pattern = re.compile(r'\b(' + '|'.join(MONTH_ABBREVIATIONS.keys()) + r')')
+_dated_span_pattern = re.compile(r'(?<![^)])[^)]*\b\d{4}\)')
+
+def _abbreviate_month(m: re.Match) -> str:
+    return MONTH_ABBREVIATIONS[m.group(1)]
+
+def _abbreviate_months_in_span(m: re.Match) -> str:
+    return _month_pattern.sub(_abbreviate_month, m.group(0))
 
 def abbreviate_months_in_citation(text: str) -> str:
     """
     Replace full month names with their §4-600 abbreviations,
     but only when they appear in a parenthesis that ends with a 4-digit year.
     """
-    return _month_pattern.sub(lambda m: MONTH_ABBREVIATIONS[m.group(1)], text)
+    if ')' not in text:
+        return text
+    return _dated_span_pattern.sub(_abbreviate_months_in_span, text)
 
 
 # Pre-compile: match journal names only when followed by volume/reporter/page
@@ -60,6 +70,8 @@ _journal_pattern = re.compile(
     r'(?=\s+\d+\s+[A-Za-z\.]+\s+\d+)',
     re.IGNORECASE
 )
+# Case-folded keys, so any casing the pattern accepts looks up directly
+_journal_by_casefold = {k.casefold(): v for k, v in JOURNAL_ABBREVIATIONS.items()}
 
 def abbreviate_journals_in_citation(text: str) -> str:
     """
@@ -67,38 +79,45 @@ def abbreviate_journals_in_citation(text: str) -> str:
     abbreviations—but only when they appear in a citation.
     """
     def _repl(m):
-        # normalize to title case so it always keys correctly
-        key = m.group(1).title()
-        return JOURNAL_ABBREVIATIONS[key]
+        return _journal_by_casefold[m.group(1).casefold()]
     return _journal_pattern.sub(_repl, text)
 
 
+# Capturing, so split() yields [sep, word, sep, word, ..., sep]
+_word_pattern = re.compile(r'\b([A-Za-z][A-Za-z\'\.]*)\b')
+
 def abbreviate_case_name(name: str) -> str:
     """
     Replace party-name words with their §4-100 abbreviations.
     Only matches whole words (e.g. “Justice” → “Just.”).
     """
-    def _replace(m: re.Match) -> str:
-        w = m.group(0)
-        return WORD_ABBREVIATIONS.get(w, w)
-    return re.sub(r'\b[A-Za-z][A-Za-z\'\.]*\b', _replace, name)
+    parts = _word_pattern.split(name)
+    # look the words up in one comprehension rather than a sub() callback per word
+    parts[1::2] = [WORD_ABBREVIATIONS.get(w, w) for w in parts[1::2]]
+    return ''.join(parts)
+
+
+# Pre-compile the §4-300 omission rules, one per numbered step below
+_leading_the_pattern  = re.compile(r'^(The)\s+', re.IGNORECASE)
+_descriptor_pattern   = re.compile(r'\b(Trustee|Executor|Administrator|Administratrix)\b.*', re.IGNORECASE)
+_state_of_pattern     = re.compile(r'\bState of\s+', re.IGNORECASE)
+_city_of_pattern      = re.compile(r'(?<!^)\bCity of\s+', re.IGNORECASE)
+_locational_pattern   = re.compile(r'\b(of|County|Township|Village|District)\s+[A-Za-z ]+', re.IGNORECASE)
+_usa_pattern          = re.compile(r'United States of America', re.IGNORECASE)
+_co_corp_pattern      = re.compile(r'\b(Co|Corp|Ass\'n)\b')
+_inc_ltd_pattern      = re.compile(r'\b(Inc|Ltd|N\.A\.|F\.S\.B\.),?\s*')
 
 def omit_words_in_case_name(name: str) -> str:
     """
     Apply §4-300 omissions to a case name.
     """
     # 1) Drop leading “The ”
-    name = re.sub(r'^(The)\s+', '', name, flags=re.IGNORECASE)
+    name = _leading_the_pattern.sub('', name)
     # 2) Keep only before first comma
     name = name.split(',', 1)[0].strip()
-    # 3) On each side of “ v. ”, keep only first party
-    if ' v. ' in name:
-        left, right = name.split(' v. ', 1)
-        right = right.split(',', 1)[0]
-        name = f"{left} v. {right}"
-    # 4) “In re” → keep only up to comma
-    if name.lower().startswith('in re'):
-        name = name.split(',', 1)[0]
+    # 3) On each side of “ v. ”, keep only first party, and
+    # 4) “In re” → keep only up to comma:
+    #    both are already done by step 2, no comma survives it
     # 5) Collapse multiple “ ex rel.” to one, then normalize “United States of America”
     #parts = re.split(r'\s+ex rel\.', name, flags=re.IGNORECASE)
     #if len(parts) > 1:
@@ -112,27 +131,29 @@ def omit_words_in_case_name(name: str) -> str:
         #).strip()
         #return name
     # 6) Drop Trustee/Executor/Admin descriptors
-    name = re.sub(r'\b(Trustee|Executor|Administrator|Administratrix)\b.*', '', name, flags=re.IGNORECASE).strip()
+    name = _descriptor_pattern.sub('', name).strip()
     # 7) Drop “State of ”
-    name = re.sub(r'\bState of\s+', 'State ', name, flags=re.IGNORECASE)
+    name = _state_of_pattern.sub('State ', name)
     # 8) Drop “City of ” not at start
-    name = re.sub(r'(?<!^)\bCity of\s+', '', name, flags=re.IGNORECASE)
+    name = _city_of_pattern.sub('', name)
     # 9) Drop other locational phrases
-    name = re.sub(r'\b(of|County|Township|Village|District)\s+[A-Za-z ]+', '', name, flags=re.IGNORECASE)
+    name = _locational_pattern.sub('', name)
     # 10) “United States of America” → “United States”
-    name = re.sub(r'United States of America', 'United States', name, flags=re.IGNORECASE)
+    name = _usa_pattern.sub('United States', name)
     # 11) Keep only last name for individuals
     def _last(p: str) -> str:
         ps = p.split()
         return ps[-1] if len(ps) > 1 else p
-    if ' v. ' in name:
-        a, b = name.split(' v. ')
-        name = f"{_last(a)} v. {_last(b)}"
+    v_idx = name.find(' v. ')
+    if v_idx >= 0:
+        # first party on each side, even if a second “ v. ” follows
+        right = name[v_idx+4:].split(' v. ', 1)[0]
+        name = f"{_last(name[:v_idx])} v. {_last(right)}"
     else:
         name = _last(name)
     # 12) If Co./Corp. present, drop Inc./Ltd./etc.
-    if re.search(r'\b(Co|Corp|Ass\'n)\b', name):
-        name = re.sub(r'\b(Inc|Ltd|N\.A\.|F\.S\.B\.),?\s*', '', name)
+    if _co_corp_pattern.search(name):
+        name = _inc_ltd_pattern.sub('', name)
     return name.strip()
 
 def map_federal_court_level(court_str: str) -> Optional[str]:
@@ -186,11 +207,96 @@ def validate_reporter_for_court(citation_components: Dict[str, Any]) -> bool:
             raise ValueError(f"Reporter '{reporter}' not valid for {st_level}. Allowed: {allowed}")
     return True
 
+# Placeholder synthetic case DB, keyed "volume_reporter_page"
+_case_db = {
+    "291_U.S._193": {"text": "Brown v. Board opinion text here...", "valid_pin_range": (190, 210)},
+    "347_U.S._483": {"text": "Brown v. Board decision text...", "valid_pin_range": (480, 500)}
+}
+
+# Memoized so a citation repeated through a brief is only looked up once;
+# out-of-range pincites raise and so are never cached
+@functools.lru_cache(maxsize=1024)
+def _fetch_case_data_cached(
+    vol: str,
+    rep: str,
+    page: str,
+    pincite: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    key = f"{vol}_{rep}_{page}"
+    rec = _case_db.get(key)
+    if rec and pincite:
+        try:
+            if '-' in pincite:
+                start, end = map(int, pincite.split('-'))
+                low, high = rec["valid_pin_range"]
+                if not (low <= start <= high and low <= end <= high):
+                    raise ValueError(f"Pincite range {pincite} outside {low}-{high}")
+            else:
+                val = int(pincite)
+                low, high = rec["valid_pin_range"]
+                if not (low <= val <= high):
+                    raise ValueError(f"Pincite {val} outside {low}-{high}")
+        except Exception as e:
+            raise ValueError(str(e))
+    return rec
+
+
+# Pre-compile: document splitting and §4-810/820 spacing/period rules
+_semicolon_split_pattern = re.compile(r';\s*')
+_spaced_initials_pattern = re.compile(r'\b([A-Z])\.\s+([A-Z])\.')
+_bare_word_pattern       = re.compile(r'(?<![\.\"’])\b([A-Za-z]{2,})\b(?!\.)')
+
+# Pre-compile: volume and reporter of a short form ("347 U.S. at 490")
+_short_vol_rep_pattern = re.compile(
+    r'(?P<volume>\d+)\s+(?P<reporter>\S.*?)\s+(?:at\s+)?\d+\b'
+)
+
+# Pre-compile: the "123 U.S. 456" shape _collect_format_errors looks for
+_volume_reporter_page_pattern = re.compile(r"\d+\s+[A-Za-z\.']+\s+\d+")
+
+# Pre-compile: §1-400 signals, stripped from quotes (*see*, ...) and
+# formatted when they open a clause (longest first, so "see also" wins over "see")
+_signal_marker_pattern = re.compile(
+    r'\*(' + '|'.join(sorted((re.escape(sig.strip('*')) for sig in VALID_CITATION_SIGNALS),
+                              key=len, reverse=True)) + r')\*',
+    re.IGNORECASE
+)
+_signal_format_pattern = re.compile(
+    r'(^|[.;]\s+|(?<=[.;]\s)\s*)('
+    + '|'.join(re.escape(sig) for sig in sorted(CITATION_SIGNALS_ORDERED, key=len, reverse=True))
+    + r')\s',
+    re.IGNORECASE
+)
+
+# Pre-compile: §6-100 quote-mark normalization and spaced ellipses
+_quote_marks_table = str.maketrans({'“': "'", '”': "'", '"': "'"})
+_ellipsis_pattern = re.compile(r'\.{3,}')
+
+# Pre-compile: cross-references (case-sensitive) and explanatory history /
+# attribution phrases (any case) that format_citation italicizes
+_format_tags_pattern = re.compile(
+    r'\b(?:id\.|supra\b|infra\b)'
+    r'|(?i:\b(?:aff’d|overruled by|as quoted in)\b)'
+)
+
+# Memoized matches: validate_full_citation matches the same citation twice
+# (format check, then parse), and auto_fix_citation re-validates its inputs.
+# Match objects are read-only, so sharing them between callers is safe.
+@functools.lru_cache(maxsize=4096)
+def _match_citation(text: str) -> Optional[re.Match]:
+    return PATTERNS['citation'].match(text)
+
+@functools.lru_cache(maxsize=4096)
+def _validator_matches(kind: str, text: str) -> bool:
+    return VALIDATORS[kind].match(text) is not None
+
 # ----- Main CitationChecker Class -----
 class CitationChecker:
     def __init__(self):
         """Store parsed full‐form citations as {volume_reporter_page: components}."""
         self.full_citations: Dict[str, Dict[str, Any]] = {}
+        # (volume, reporter) → first full_citations key with that pair
+        self._by_vol_rep: Dict[Tuple[str, str], str] = {}
         self.last_short_key = None
         self.enable_pincite_check = False
         self.enable_quote_check   = False  
@@ -200,18 +306,11 @@ class CitationChecker:
         Dispatch to the appropriate regex‐based validator from VALIDATORS.
         Raises ValueError if no match.
         """
-        validator = VALIDATORS.get(kind)
-        if validator is None:
+        if kind not in VALIDATORS:
             raise ValueError(f"No validator found for kind '{kind}'")
 
-        # If it's a list of patterns, try each one
-        if isinstance(validator, list):
-            for pat in validator:
-                if pat.match(citation):
-                    return True
-        else:
-            if validator.match(citation):
-                return True
+        if _validator_matches(kind, citation):
+            return True
 
         raise ValueError(f"Invalid {kind} citation format")
 
@@ -221,17 +320,26 @@ class CitationChecker:
         parse them into components, and store in self.full_citations.
         """
         self.full_citations.clear()
+        self._by_vol_rep.clear()
 
         # split on semicolons so we catch multiple citations in one string
-        for segment in re.split(r';\s*', text):
+        for segment in _semicolon_split_pattern.split(text):
        # Phase 1: core case citations (unchanged)
-            for m in PATTERNS['citation'].finditer(segment):
-                comps = m.groupdict()
-                key = f"{comps['volume']}_{comps['reporter']}_{comps['page']}"
-                self.full_citations[key] = comps
+            # CITATION_PATTERN is anchored and ends in "(Court Year)$", so a
+            # segment that doesn't end in ")" never reaches the reporter list
+            if segment.endswith((')', ')\n')):
+                for m in PATTERNS['citation'].finditer(segment):
+                    comps = m.groupdict()
+                    key = f"{comps['volume']}_{comps['reporter']}_{comps['page']}"
+                    self.full_citations[key] = comps
+                    self._by_vol_rep.setdefault((comps['volume'], comps['reporter']), key)
 
             # Phase 2: advanced citations (C.F.R., agency, exec. orders, etc.)
             for kind, pat in advancedregex.ADVANCED_PATTERNS.items():
+                # the fused admin alternation costs more than all the other
+                # kinds together; skip it where none of its literals occur
+                if kind == 'admin' and not advancedregex.admin_candidates(segment):
+                    continue
                 for m in pat.finditer(segment):
                     comps = m.groupdict()
                     # namespace by kind so you don’t collide with case‐keys
@@ -250,7 +358,7 @@ class CitationChecker:
            • apostrophe‐contraction forms (Eng’g)
         """
         # 1) D. C. → D.C.
-        citation = re.sub(r'\b([A-Z])\.\s+([A-Z])\.', r'\1.\2.', citation)
+        citation = _spaced_initials_pattern.sub(r'\1.\2.', citation)
 
         # 2) Add trailing period to 2+ letter words (unless ALL‐CAP or contains apostrophe)
         def _add_dot(m: re.Match) -> str:
@@ -261,11 +369,7 @@ class CitationChecker:
                 return term
             return term + "."
 
-        citation = re.sub(
-            r'(?<![\.\"’])\b([A-Za-z]{2,})\b(?!\.)',
-            _add_dot,
-            citation
-        )
+        citation = _bare_word_pattern.sub(_add_dot, citation)
         return citation
     
 
@@ -276,15 +380,15 @@ class CitationChecker:
         - If ≥50 words or special emphasis requested, indent as a block.
         - Always follow immediately with citation_str.
         """
-        words = quote.split()
-        # normalize quote marks: strip any existing curly quotes
-        quote = quote.replace('“', '"').replace('”', '"')
-        # convert any straight double‐quotes inside to straight single‐quotes
-        quote = quote.replace('"', "'")
+        # only whether there are 50 words matters, so stop splitting there
+        is_block = len(quote.split(None, 49)) >= 50
+        # normalize quote marks: curly and straight double‐quotes inside all
+        # become straight single‐quotes, in one pass
+        quote = quote.translate(_quote_marks_table)
         # Principle 4: internal omissions shown as spaced ellipses
-        quote = re.sub(r'\.{3,}', ' . . . ', quote)
+        quote = _ellipsis_pattern.sub(' . . . ', quote)
 
-        if len(words) < 50:
+        if not is_block:
             # inline: if it starts lowercase, bracket‐capitalize that first letter
             if quote and quote[0].islower():
                 quote = f"[{quote[0].upper()}]{quote[1:]}"
@@ -299,17 +403,16 @@ class CitationChecker:
         § 6-300 — italicize (or underline) introductory signals *only* when
         they open a citation clause or citation sentence.
         """
-        opener = r'(^|[.;]\s+)'  # start of string OR just after . or ;
         tag = (lambda x: f"<i>{x}</i>") if style == "italic" else (lambda x: f"__{x}__")
         def wrap(m: re.Match) -> str:
             prefix, signal = m.groups()
             # the trailing space is consumed by the regex \s, so we add it back
             return prefix + tag(signal) + " "
 
-        for sig in CITATION_SIGNALS_ORDERED:
-            pattern = rf"{opener}({re.escape(sig)})\s"
-            text = re.sub(pattern, wrap, text, flags=re.IGNORECASE)
-        return text
+        # opens at start of string OR just after . or ; (including right after
+        # a signal such as "cf." whose trailing space was consumed by the
+        # previous match)
+        return _signal_format_pattern.sub(wrap, text)
 
     def format_citation(self, comps: Dict[str, Any], style: str = "italic") -> str:
         """
@@ -325,30 +428,22 @@ class CitationChecker:
           - cross-refs: id., supra, infra
         """
 
-        # 1) build the raw string:
-        s = f"{comps['case_name']} {comps['volume']} {comps['reporter']} {comps['page']}"
+        # 1) build the string with comps['case_name'] already wrapped in
+        #    <i>…</i> (or __…__ if underlining); it always leads, so there is
+        #    no need to search for it afterwards
+        tag_open, tag_close = ("<i>", "</i>") if style == "italic" else ("__", "__")
+        s = (f"{tag_open}{comps['case_name']}{tag_close} "
+             f"{comps['volume']} {comps['reporter']} {comps['page']}")
         if comps.get('pinpoint'):
             s += f", {comps['pinpoint']}"
         s += f" ({comps['court']} {comps['year']})"
 
-        # 2) wrap comps['case_name'] in <i>…</i> (or __…__ if underlining)
-        if style == "italic":
-            s = s.replace(comps['case_name'], f"<i>{comps['case_name']}</i>")
-        else:  # underline
-            s = s.replace(comps['case_name'], f"__{comps['case_name']}__")
-
-        # 3) likewise for id./supra/infra:
-        for x in ("id.", "supra", "infra"):
-            pattern = rf"\b{x}\b"
-            replacement = f"<i>{x}</i>" if style == "italic" else f"__{x}__"
-            s = re.sub(pattern, replacement, s)
-
-        for phrase in ("aff’d", "overruled by", "as quoted in"):
-            pattern = rf"(?i)\b{re.escape(phrase)}\b"
-            def repl(m):
-                txt = m.group(0)
-                return f"<i>{txt}</i>" if style == "italic" else f"__{txt}__"
-            s = re.sub(pattern, repl, s)
+        # 2) likewise for id./supra/infra and the history/attribution
+        #    phrases, in one pass
+        def repl(m):
+            txt = m.group(0)
+            return f"<i>{txt}</i>" if style == "italic" else f"__{txt}__"
+        s = _format_tags_pattern.sub(repl, s)
 
         return self._apply_signal_formatting(s, style)
 
@@ -360,22 +455,21 @@ class CitationChecker:
         §6-500 Short‐form based on the kind of source,
         with automatic Id./supra when in same discussion.
         """
-        # Build a ShortKey for this work + pinpoint
+        # Identify this work + pinpoint
         pin = full_comps.get('pinpoint') or full_comps.get('page') or full_comps.get('section')
-        parallels = tuple(sorted(
-            [(p['volume'], p['reporter'], p['page'])
-             for p in full_comps.get('parallel', [])]
-        ))
-        key = ShortKey(
-            kind=kind,
-            volume=full_comps.get('volume'),
-            reporter=full_comps.get('reporter') or full_comps.get('code') or full_comps.get('title'),
-            pin=pin,
-            parallels=parallels
-        )
+        volume = full_comps.get('volume')
+        reporter = full_comps.get('reporter') or full_comps.get('code') or full_comps.get('title')
+        parallel = full_comps.get('parallel')
+        parallel_keys = tuple(sorted(
+            [(p['volume'], p['reporter'], p['page']) for p in parallel]
+        )) if parallel else ()
 
         # 1) If same work as last time → Id. at pin
-        if self.last_short_key == key:
+        #    (compare fields directly; a ShortKey is only built to be saved)
+        last = self.last_short_key
+        if (last is not None and last.kind == kind and last.volume == volume
+                and last.reporter == reporter and last.pin == pin
+                and last.parallels == parallel_keys):
             if pin:
                 return f"Id. at {pin}."
             else:
@@ -434,7 +528,13 @@ class CitationChecker:
             raise ValueError("Unsupported short form kind")
 
         # 3) Save this key for the next call
-        self.last_short_key = key
+        self.last_short_key = ShortKey(
+            kind=kind,
+            volume=volume,
+            reporter=reporter,
+            pin=pin,
+            parallels=parallel_keys
+        )
         # ensure trailing period on every short‐form
         if not short.endswith('.'):
             short += '.'
@@ -448,8 +548,13 @@ class CitationChecker:
         - malformed parenthetical contents
         """
         errors: List[CitationError] = []
+        # locate the parenthetical once; every check below reuses these
+        open_paren = citation.find('(')
+        close_paren = citation.rfind(')')
+        has_parens = open_paren >= 0 and close_paren >= 0
+
         # 1) Parentheses
-        if '(' not in citation or ')' not in citation:
+        if not has_parens:
             errors.append(
                 CitationError(
                     message="Missing parentheses around court and year (…)",
@@ -460,7 +565,7 @@ class CitationChecker:
             )
 
         # 2) Comma before parenthetical
-        prefix = citation.split('(', 1)[0]
+        prefix = citation[:open_paren] if open_paren >= 0 else citation
         if ',' not in prefix:
             errors.append(
                 CitationError(
@@ -472,7 +577,7 @@ class CitationChecker:
             )
 
         # 3) Volume/Reporter/Page
-        if not re.search(r"\d+\s+[A-Za-z\.']+\s+\d+", prefix):
+        if not _volume_reporter_page_pattern.search(prefix):
             errors.append(
                 CitationError(
                     message="Missing volume, reporter, or page (e.g., ‘123 U.S. 456’).",
@@ -483,15 +588,15 @@ class CitationChecker:
             )
 
         # 4) Parenthetical contents
-        if '(' in citation and ')' in citation:
-            inner = citation[citation.find('(')+1 : citation.rfind(')')]
+        if has_parens:
+            inner = citation[open_paren+1 : close_paren]
             parts = inner.rsplit(' ', 1)
             if len(parts) != 2:
                 errors.append(
                     CitationError(
                         message="Parenthetical must be of the form ‘(Court Year)’.",
-                        start=citation.find('('),
-                        end=citation.rfind(')')+1,
+                        start=open_paren,
+                        end=close_paren+1,
                         field="parenthetical_contents"
                     )
                 )
@@ -504,7 +609,7 @@ class CitationChecker:
                         CitationError(
                             message=f"Invalid year ‘{year_part}’; expected four digits.",
                             start=citation.rfind(' ')+1,
-                            end=citation.rfind(')'),
+                            end=close_paren,
                             field="year"
                         )
                     )
@@ -514,14 +619,14 @@ class CitationChecker:
                     errors.append(
                         CitationError(
                             message="Missing court name before the year inside parentheses.",
-                            start=citation.find('(')+1,
+                            start=open_paren+1,
                             end=citation.find(' '),
                             field="court"
                         )
                     )
 
         # 7) Final structure check
-        if not errors and not PATTERNS['citation'].match(citation):
+        if not errors and not _match_citation(citation):
             errors.append(
                 CitationError(
                     message="Citation structure invalid. Expected: CaseName Volume Reporter Page (Court Year).",
@@ -563,7 +668,7 @@ class CitationChecker:
             raise CitationValidationException(errors)
 
         # — Parse —
-        m = PATTERNS['citation'].match(citation)
+        m = _match_citation(citation)
         if m is None:
             raise CitationValidationException([
                 CitationError(
@@ -628,13 +733,20 @@ class CitationChecker:
 
 
     def _remove_signals(self, txt: str) -> str:
-        sigs = sorted([re.escape(s.strip('*')) for s in VALID_CITATION_SIGNALS], key=len, reverse=True)
-        pat = r'\*(' + '|'.join(sigs) + r')\*'
-        return re.sub(pat, '', txt, flags=re.IGNORECASE).strip()
+        return _signal_marker_pattern.sub('', txt).strip()
 
     def _check_quote(self, prov: str, orig: str) -> bool:
-        sm = difflib.SequenceMatcher(None, prov, orig)
         thresh = 0.3 if len(prov) < 50 else 0.6
+        # ratio() can't exceed 2*min(len)/sum(len) (SequenceMatcher's
+        # real_quick_ratio), so a short quote against a long opinion fails
+        # before we pay for indexing `orig`
+        total = len(prov) + len(orig)
+        if total and 2.0 * min(len(prov), len(orig)) / total <= thresh:
+            return False
+        sm = difflib.SequenceMatcher(None, prov, orig)
+        # quick_ratio() (character counts) is likewise an upper bound
+        if sm.quick_ratio() <= thresh:
+            return False
         return sm.ratio() > thresh
 
     def fetch_case_data(
@@ -647,27 +759,9 @@ class CitationChecker:
         """
         Placeholder synthetic DB lookup. Raises ValueError if pincite is out of range.
         """
-        db = {
-            "291_U.S._193": {"text": "Brown v. Board opinion text here...", "valid_pin_range": (190, 210)},
-            "347_U.S._483": {"text": "Brown v. Board decision text...", "valid_pin_range": (480, 500)}
-        }
-        key = f"{vol}_{rep}_{page}"
-        rec = db.get(key)
-        if rec and pincite:
-            try:
-                if '-' in pincite:
-                    start, end = map(int, pincite.split('-'))
-                    low, high = rec["valid_pin_range"]
-                    if not (low <= start <= high and low <= end <= high):
-                        raise ValueError(f"Pincite range {pincite} outside {low}-{high}")
-                else:
-                    val = int(pincite)
-                    low, high = rec["valid_pin_range"]
-                    if not (low <= val <= high):
-                        raise ValueError(f"Pincite {val} outside {low}-{high}")
-            except Exception as e:
-                raise ValueError(str(e))
-        return rec
+        rec = _fetch_case_data_cached(vol, rep, page, pincite)
+        # a copy, so callers can't edit _case_db or the cached record
+        return dict(rec) if rec is not None else None
 
     def validate_short_citation(self, short: str, full: str) -> bool:
         sf = short.split(',')[0].strip()
@@ -676,7 +770,24 @@ class CitationChecker:
         return True
 
     def resolve_short_citation(self, short: str) -> Dict[str, Any]:
+        # "347 U.S. at 490" names its volume and reporter directly; match
+        # them exactly, through the index or, if it is not filled, by scan
+        m = _short_vol_rep_pattern.search(short)
+        if m:
+            vol_rep = (m.group('volume'), m.group('reporter'))
+            key = self._by_vol_rep.get(vol_rep)
+            if key is not None:
+                return self.full_citations[key]
+            for grp in self.full_citations.values():
+                if (grp.get('volume'), grp.get('reporter')) == vol_rep:
+                    return grp
+            raise KeyError(f"No matching full citation for short form: '{short}'")
+
+        # unparseable short form: loose substring scan
         for key, grp in self.full_citations.items():
+            # advanced (kind-prefixed) entries have no volume/reporter
+            if 'volume' not in grp or 'reporter' not in grp:
+                continue
             if grp['volume'] in short and grp['reporter'] in short:
                 return grp
         raise KeyError(f"No matching full citation for short form: '{short}'")
@@ -0,0 +1,128 @@
+import re
+from constants import ALLOWED_REPORTERS
+import advancedregex
+
+def trie_regex(strs):
+    """
+    Build a regex source matching exactly `strs`, factored into a prefix
+    trie (e.g. F.2d / F.3d → ``F\\.[23]d``) so shared prefixes are matched
+    once. Siblings followed by the same sub-pattern collapse into one
+    character class. At every node the longer continuations are tried
+    before stopping, which is the same preference as listing the
+    alternatives longest-first.
+    """
+    trie = {}
+    for s in strs:
+        node = trie
+        for ch in s:
+            node = node.setdefault(ch, {})
+        node[''] = {}   # end-of-word marker
+
+    def emit(node):
+        # group the edges by what follows them, so e.g. 2d|3d becomes [23]d
+        tails = {}
+        for ch, child in sorted(node.items()):
+            if ch:
+                tails.setdefault(emit(child), []).append(re.escape(ch))
+        branches = [(chs[0] if len(chs) == 1 else '[' + ''.join(chs) + ']') + tail
+                    for tail, chs in tails.items()]
+        if not branches:
+            return ''
+        if len(branches) > 1:
+            body = '(?:' + '|'.join(branches) + ')'
+            return body + '?' if '' in node else body
+        return f'(?:{branches[0]})?' if '' in node else branches[0]
+
+    return emit(trie)
+
+
+# Build a regex for all allowed reporters, as a trie to avoid prefix collisions
+allowed_reporters_regex = trie_regex(ALLOWED_REPORTERS)
+
+# 1) Full-form case citations (e.g. A v. B, C, D & E, 347 U.S. 483 (U.S. 1954))
+CITATION_PATTERN = re.compile(
+    # capture everything up to the *last* comma before the volume,
+    # so internal commas stay inside case_name but the final comma is required
+    r'^(?=(?s:.*)\s\d{4}\)$)'       # check the "… YYYY)" tail first, from the right,
+                                    # so a bad ending fails in one pass instead
+                                    # of once per comma the case_name backtracks to
+    rf'(?P<case_name>.+),'          # case_name ends at that comma
+    r'(?=\s*\d+\s)'                 # assert that comma is right before volume
+    r'\s*(?P<volume>\d+)\s+'        # volume
+    rf'(?P<reporter>({allowed_reporters_regex}))\s+'  # reporter
+    r'(?P<page>\d+)'                # page
+    r'(?:,\s*(?P<pinpoint>\d+(?:-\d+)?))?'  # optional pinpoint
+    r'\s*\((?P<court>.+?)\s+(?P<year>\d{4})\)$'  # (Court Year)
+)
+
+# 2) Statutes: federal (U.S.C.) and all states
+FEDERAL_STATUTE_PATTERN = re.compile(
+    # match “U.S.C.” or “U.S.C.A.” then § and section; the letters are
+    # spelled as classes instead of IGNORECASE (\u017f is the long s that
+    # IGNORECASE would also have folded to s)
+    r'^(?P<title>\d+)\s+'             # title number
+    r'[Uu]\.[Ss\u017f]\.[Cc]\.(?:[Aa]\.)?\s+'  # U.S.C. or U.S.C.A.
+    r'§\s*(?P<section>[\d\w\(\)\-/]+)'# §section
+    r'(?:\s*\((?P<extra>.+?)\))?$'    # optional parenthetical
+)
+
+STATE_STATUTE_PATTERNS = [
+    re.compile(
+        r'^\d+\s+[A-Za-z\.]+\s+Code\s+§\s*[\d\.\-/]+'  
+        r'(?:,\s*et seq\.)?(?:\s*\(.+\))?$'
+    )
+]
+STATUTE_PATTERNS = [FEDERAL_STATUTE_PATTERN] + STATE_STATUTE_PATTERNS
+
+# 3) Court rules
+COURT_RULE_PATTERNS = [
+    re.compile(r'^(?:Fed\. R\. Civ\. P\.|Fed\. R\. Crim\. P\.)\s+\d+(?:\([^)]+\))?(?:\.\d+)*$'),
+    re.compile(r'^[A-Z][a-zA-Z\.]+\sR\.\s(?:Civ\. P\.|Crim\. P\.|App\. P\.)\s+\d+(?:\([^)]+\))?(?:\.\d+)*$'),
+    re.compile(r'^(?:Practice Book §\s*\d+-\d+|CPLR\s+\d+\(\d+\))$')
+]
+
+# 4) Books & treatises
+BOOK_PATTERNS = [
+    re.compile(r'^\d+\s+[A-Z][A-Za-z\.\s,&]+§\s*\d+(?:\.\d+)?(?:,\s*n\.\d+)?\s*\(\d{4}\)$'),
+    re.compile(r'^[A-Z].+?,\s*\d+\s+[A-Z].+?ed\.+\s*\d{4}$')
+]
+
+# 5) Law review & treatise articles
+ARTICLE_PATTERNS = [
+    re.compile(
+        r'^[A-Z][^,]+,\s+[^,]+,\s+\d+\s+[A-Za-z\.]+(?:\s+[A-Za-z\.]+)*\s+\d+(?:,\s*\d+)?\s*\(\d{4}\)$'
+    ),
+    re.compile(r'^[A-Z][^,]+,\s+(?:Note|Comment),\s+\d+\s+[A-Za-z\.]+\s+\d+\s*\(\d{4}\)$')
+]
+
+# Consolidated core patterns map
+PATTERNS = {
+    # allow newcitechecker to do PATTERNS['citation']
+    'citation':      CITATION_PATTERN,
+    'case':          CITATION_PATTERN,
+    # for validate('statute', …) to accept "12 C.S.C. § 3456"
+    'statute':       STATUTE_PATTERNS + [
+        re.compile(r'^\d+\s+[A-Za-z\.]+\s+§\s*[\d\w\(\)\-/]+(?:\s*\(.+\))?$')
+    ],
+    'court_rule':    COURT_RULE_PATTERNS,
+    'book':          BOOK_PATTERNS,
+    'article':       ARTICLE_PATTERNS,
+}
+
+# One alternation per multi-pattern kind, so validate() is a single match
+STATUTE_VALIDATOR    = advancedregex.combine_patterns(PATTERNS['statute'], 'statute')
+COURT_RULE_VALIDATOR = advancedregex.combine_patterns(COURT_RULE_PATTERNS, 'court_rule')
+BOOK_VALIDATOR       = advancedregex.combine_patterns(BOOK_PATTERNS, 'book')
+ARTICLE_VALIDATOR    = advancedregex.combine_patterns(ARTICLE_PATTERNS, 'article')
+
+# Dispatch validators for core types
+VALIDATORS = {
+    'case':        PATTERNS['case'],
+    'statute':     STATUTE_VALIDATOR,
+    'court_rule':  COURT_RULE_VALIDATOR,
+    'book':        BOOK_VALIDATOR,
+    'article':     ARTICLE_VALIDATOR,
+}
+
+PATTERNS.update(advancedregex.ADVANCED_PATTERNS)
+VALIDATORS.update(advancedregex.ADVANCED_VALIDATORS)